@@ -1,12 +1,21 @@
-import os
-import re
 import csv
 import json
+import sys
 import numpy as np
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 
-# Regex patterns (unchanged)
+# Prefer RE2's linear-time engine for the log patterns when it is installed
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Regex patterns; PYCOM_PATTERN captures date and inner time as separate numeric groups
 WSJT_PATTERN = re.compile(
     r'^(\d{6}_\d{6})\s+'      
     r'(\d+\.\d+)\s+'           
@@ -19,10 +28,10 @@ WSJT_PATTERN = re.compile(
 )
 
 PYCOM_PATTERN = re.compile(
-    r'^(\d{4}-\d{2}-\d{2})\s+'                  
-    r'(\d{2}:\d{2})\s+'                         
+    r'^(\d{4})-(\d{2})-(\d{2})\s+'
+    r'\d{2}:\d{2}\s+'
     r'INFO\s+\[Pycom\.lib\.csnsat\.csnSatManager\]\s+'
-    r'Timestamp:\s+(\d{2}:\d{2}:\d{2}),\s+'      
+    r'Timestamp:\s+(\d{2}):(\d{2}):(\d{2}),\s+'      
     r'Sat:\s+(\S+),\s+'
     r'Az:\s+([\d\.]+),\s+'
     r'El:\s+([\d\.-]+),\s+'
@@ -40,6 +49,15 @@ PYCOM_PATTERN = re.compile(
     r'RIT Freq:\s+(-?\d+)'
 )
 
+# Bound once so the per-line parser skips the attribute lookup
+_wsjt_match = WSJT_PATTERN.match
+
+# Columns of parsed WSJT entries compared numerically in find_echoes
+WSJT_DTYPE = np.dtype([
+    ('ts_epoch', 'f8'),
+    ('freq', 'f8'),
+])
+
 # File paths (adjust if needed)
 WSJT_TX_LOG = Path(r'C:\Users\steve\AppData\Local\WSJT-X\ALL.TXT')
 WSJT_RX_LOG = Path(r'C:\Users\steve\AppData\Local\WSJT-X - None\ALL.TXT')
@@ -49,24 +67,71 @@ PYCOM_LOG = Path(r'C:\Users\steve\Pycom\logs\pycom.log')
 OUTPUT_DIR = Path.cwd() / "echo_passes"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-TIME_TOLERANCE = timedelta(seconds=1)
+CSV_HEADING = [
+    "Timestamp", "Tx Offset Hz", "Rx Offset Hz", "Offset Delta Hz",
+    "Message", "SNR dB", "DT s", "Sat", "Az °", "El °", "Range km",
+    "Main Hz", "Sub Hz", "Main+Sub Hz", "Doppler up Hz", "Doppler down Hz", "Tuning Offset Hz",
+    "RIT", "RIT Freq Hz", "Time diff s", "Drift", "Residual Doppler",
+    "Doppler up rate", "Doppler down rate"
+]
+
+# Time limits in seconds, compared against the cached 'ts_epoch' values
+TIME_TOLERANCE = 1.0
 MAX_TIME_DIFF_FOR_MATCH = 5
-MAX_GAP_BETWEEN_ECHOES = timedelta(minutes=30)
-PASS_MARGIN = timedelta(minutes=10)  # Extra window around pass for full track
+MAX_GAP_BETWEEN_ECHOES = 1800.0
+PASS_MARGIN = 600.0  # Extra window (seconds) around pass for full track
+ECHO_BLOCK_SIZE = 256  # Tx rows compared against Rx rows at once in find_echoes
+READ_BUFFER_SIZE = 1 << 20  # Bytes per read when scanning log files
+
+
+def read_log_lines(path: Path):
+    """
+    Yield the lines of a log file, reading it in large binary chunks.
+    Each chunk is decoded in one call; a partial last line is carried over
+    to the next chunk. Lines from CRLF files keep their trailing '\\r'.
+    """
+    tail = b''
+    with path.open('rb') as f:
+        while True:
+            chunk = f.read(READ_BUFFER_SIZE)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            end = chunk.rfind(b'\n')
+            if end < 0:
+                tail = chunk
+                continue
+            tail = chunk[end + 1:]
+            yield from chunk[:end].decode('utf-8', 'replace').split('\n')
+    if tail:
+        yield tail.decode('utf-8', 'replace')
+
+
+@lru_cache(maxsize=4096)
+def parse_wsjt_timestamp(ts_str: str):
+    """
+    Convert a WSJT-X 'YYMMDD_HHMMSS' stamp to (datetime, epoch seconds).
+    Cached because every decode in a T/R cycle shares the same stamp.
+    """
+    yy = 2000 + int(ts_str[:2])
+    mm, dd = int(ts_str[2:4]), int(ts_str[4:6])
+    hh, mi, ss = int(ts_str[7:9]), int(ts_str[9:11]), int(ts_str[11:13])
+    ts = datetime(yy, mm, dd, hh, mi, ss)
+    return ts, ts.replace(tzinfo=timezone.utc).timestamp()
 
 
 def parse_wsjt_line(line: str):
-    match = WSJT_PATTERN.match(line.strip())
+    # No strip() needed: the pattern is anchored and msg.strip() below drops
+    # any trailing whitespace/newline picked up by the final capture
+    match = _wsjt_match(line)
     if not match:
         return None
     ts_str, freq_str, rxtx, mode, snr_str, dt_str, f_str, msg = match.groups()
     try:
-        yy = 2000 + int(ts_str[:2])
-        mm, dd = int(ts_str[2:4]), int(ts_str[4:6])
-        hh, mi, ss = int(ts_str[7:9]), int(ts_str[9:11]), int(ts_str[11:13])
-        ts = datetime(yy, mm, dd, hh, mi, ss)
+        ts, ts_epoch = parse_wsjt_timestamp(ts_str)
         return {
             'ts': ts,
+            'ts_epoch': ts_epoch,
             'ts_str': ts_str,
             'freq': float(freq_str),
             'type': rxtx,
@@ -85,37 +150,92 @@ def load_wsjt_entries(path: Path, entry_type: str):
     if not path.exists():
         print(f"Warning: File not found: {path}")
         return entries
-    with path.open('r', encoding='utf-8') as f:
-        for line in f:
-            parsed = parse_wsjt_line(line)
-            if parsed and parsed['type'] == entry_type:
-                entries.append(parsed)
+    parse = parse_wsjt_line
+    append = entries.append
+    marker = f' {entry_type} '  # Cheap prefilter before running the regex
+    for line in read_log_lines(path):
+        if marker not in line:
+            continue
+        parsed = parse(line)
+        if parsed and parsed['type'] == entry_type:
+            append(parsed)
     return entries
 
 
+def wsjt_to_array(entries):
+    """
+    Pack the WSJT_DTYPE columns of parsed entries into a structured array.
+    """
+    return np.array(
+        [(e['ts_epoch'], e['freq']) for e in entries],
+        dtype=WSJT_DTYPE
+    )
+
+
+def group_by_message(entries):
+    """
+    Group entry indices by (mode, msg), each group ordered by time.
+    Returns: dict of (mode, msg) -> index array
+    """
+    def key(i):
+        return entries[i]['mode'], entries[i]['msg']
+
+    order = sorted(range(len(entries)), key=lambda i: (key(i), entries[i]['ts_epoch']))
+    return {k: np.fromiter(g, dtype=np.intp) for k, g in groupby(order, key=key)}
+
+
 def find_echoes(tx_entries, rx_entries):
-    echoes = []
-    for tx in tx_entries:
-        for rx in rx_entries:
-            if (rx['mode'] != tx['mode'] or
-                rx['msg'] != tx['msg'] or
-                abs((rx['ts'] - tx['ts']).total_seconds()) > TIME_TOLERANCE.total_seconds() or
-                rx['freq'] == tx['freq'] or
-                'M0SNZ' not in rx['msg']):
+    # Only our own callsign can be an echo; filtering keeps log order
+    tx_entries = [tx for tx in tx_entries if 'M0SNZ' in tx['msg']]
+    rx_entries = [rx for rx in rx_entries if 'M0SNZ' in rx['msg']]
+    tx_arr = wsjt_to_array(tx_entries)
+    rx_arr = wsjt_to_array(rx_entries)
+
+    # An echo must repeat the Tx mode and message exactly, so compare Tx and
+    # Rx one message at a time
+    rx_groups = group_by_message(rx_entries)
+    matches = {}  # Tx index -> Rx index
+
+    for key, tx_idx in group_by_message(tx_entries).items():
+        rx_idx = rx_groups.get(key)
+        if rx_idx is None:
+            continue
+        rx_ts = rx_arr['ts_epoch'][rx_idx]
+        rx_freq = rx_arr['freq'][rx_idx]
+
+        # Broadcast blocks of Tx rows against the Rx rows in their time span
+        for start in range(0, len(tx_idx), ECHO_BLOCK_SIZE):
+            block = tx_idx[start:start + ECHO_BLOCK_SIZE]
+            tx_ts = tx_arr['ts_epoch'][block]
+            tx_freq = tx_arr['freq'][block]
+            lo = np.searchsorted(rx_ts, tx_ts[0] - TIME_TOLERANCE, 'left')
+            hi = np.searchsorted(rx_ts, tx_ts[-1] + TIME_TOLERANCE, 'right')
+            if lo == hi:
                 continue
+            mask = ((np.abs(tx_ts[:, None] - rx_ts[None, lo:hi]) <= TIME_TOLERANCE) &
+                    (tx_freq[:, None] != rx_freq[None, lo:hi]))
+            # Pick the first matching Rx decode in log order, not the earliest
+            # timestamp, in case the Rx log is not strictly time ordered
+            first = np.where(mask, rx_idx[None, lo:hi], len(rx_entries)).min(axis=1)
+            has_match = first < len(rx_entries)
+            matches.update(zip(block[has_match].tolist(), first[has_match].tolist()))
 
-            echoes.append({
-                'ts': tx['ts'],
-                'ts_str': tx['ts_str'],
-                'tx_freq': tx['freq'],
-                'tx_offset': tx['f'],
-                'rx_freq': rx['freq'],
-                'rx_offset': rx['f'],
-                'dt': rx['dt'],
-                'snr': rx['snr'],
-                'message': tx['msg']
-            })
-            break
+    echoes = []
+    for t in sorted(matches):
+        tx = tx_entries[t]
+        match = rx_entries[matches[t]]
+        echoes.append({
+            'ts': tx['ts'],
+            'ts_epoch': tx['ts_epoch'],
+            'ts_str': tx['ts_str'],
+            'tx_freq': tx['freq'],
+            'tx_offset': tx['f'],
+            'rx_freq': match['freq'],
+            'rx_offset': match['f'],
+            'dt': match['dt'],
+            'snr': match['snr'],
+            'message': tx['msg']
+        })
     return sorted(echoes, key=lambda x: x['ts'])
 
 
@@ -124,39 +244,47 @@ def parse_pycom_log(path: Path):
     if not path.exists():
         print(f"Warning: File not found: {path}")
         return entries
-    with path.open('r', encoding='utf-8') as f:
-        for line in f:
-            m = PYCOM_PATTERN.match(line.strip())
-            if not m:
-                continue
-            log_date = m.group(1)
-            inner_time = m.group(3)
-            ts = datetime.strptime(f"{log_date} {inner_time}", '%Y-%m-%d %H:%M:%S')
-            entries.append({
-                'ts': ts,
-                'sat': m.group(4),
-                'az': float(m.group(5)),
-                'el': float(m.group(6)),
-                'range_km': float(m.group(7)),
-                'main': int(m.group(8)),
-                'sub': int(m.group(9)),
-                'dop_up': int(m.group(10)),
-                'dop_down': int(m.group(11)),
-                'dop_up_rate': int(m.group(12)),
-                'dop_down_rate': int(m.group(13)),
-                'offset': int(m.group(14)),
-                'rit': m.group(17),
-                'rit_freq': int(m.group(18))
-            })
+    match = PYCOM_PATTERN.match
+    append = entries.append
+    for line in read_log_lines(path):
+        if 'csnSatManager' not in line:
+            continue
+        m = match(line)
+        if not m:
+            continue
+        # Date from the log prefix, time from the inner Timestamp field
+        ts = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)),
+                      int(m.group(4)), int(m.group(5)), int(m.group(6)))
+        append({
+            'ts': ts,
+            'ts_epoch': ts.replace(tzinfo=timezone.utc).timestamp(),
+            'sat': m.group(7),
+            'az': float(m.group(8)),
+            'el': float(m.group(9)),
+            'range_km': float(m.group(10)),
+            'main': int(m.group(11)),
+            'sub': int(m.group(12)),
+            'dop_up': int(m.group(13)),
+            'dop_down': int(m.group(14)),
+            'dop_up_rate': int(m.group(15)),
+            'dop_down_rate': int(m.group(16)),
+            'offset': int(m.group(17)),
+            'rit': m.group(20),
+            'rit_freq': int(m.group(21))
+        })
     return sorted(entries, key=lambda x: x['ts'])
 
 
-def match_echo_to_pycom(echo, pycom_entries):
+def match_echo_to_pycom(echo, pycom_entries, pycom_ts):
     if not pycom_entries:
         return None, None
-    closest = min(pycom_entries, key=lambda p: abs((p['ts'] - echo['ts']).total_seconds()))
-    time_diff = abs((closest['ts'] - echo['ts']).total_seconds())
-    return (closest, time_diff) if time_diff < MAX_TIME_DIFF_FOR_MATCH else (None, None)
+    echo_ts = echo['ts_epoch']
+    i = bisect_left(pycom_ts, echo_ts)
+    if i == len(pycom_ts) or (i > 0 and echo_ts - pycom_ts[i - 1] <= pycom_ts[i] - echo_ts):
+        # Step back to the first of any samples sharing that timestamp
+        i = bisect_left(pycom_ts, pycom_ts[i - 1])
+    time_diff = abs(pycom_ts[i] - echo_ts)
+    return (pycom_entries[i], time_diff) if time_diff < MAX_TIME_DIFF_FOR_MATCH else (None, None)
 
 
 def group_by_pass(combined_echoes):
@@ -166,22 +294,17 @@ def group_by_pass(combined_echoes):
     passes = []
     current_pass = [combined_echoes[0]]
 
+    max_gap = MAX_GAP_BETWEEN_ECHOES
     for prev, curr in zip(combined_echoes, combined_echoes[1:]):
-        prev_has_pycom = 'pycom' in prev
-        curr_has_pycom = 'pycom' in curr
-
-        time_gap_ok = (curr['echo']['ts'] - prev['echo']['ts']) <= MAX_GAP_BETWEEN_ECHOES
-
-        if prev_has_pycom and curr_has_pycom:
-            same_sat = prev['pycom']['sat'] == curr['pycom']['sat']
-            if same_sat and time_gap_ok:
-                current_pass.append(curr)
-            else:
-                passes.append(current_pass)
-                current_pass = [curr]
-            continue
-
-        if time_gap_ok:
+        # Cheap float gap test first; the satellite name only matters when
+        # both echoes have pycom data
+        same_pass = (
+            curr['echo']['ts_epoch'] - prev['echo']['ts_epoch'] <= max_gap and
+            ('pycom' not in prev or 'pycom' not in curr or
+             prev['pycom']['sat'] == curr['pycom']['sat'])
+        )
+
+        if same_pass:
             current_pass.append(curr)
         else:
             passes.append(current_pass)
@@ -206,15 +329,18 @@ def calculate_pass_stats(pass_group):
             'center_drift': 0
         }
 
-    offset_deltas = [item['echo']['tx_offset'] - item['echo']['rx_offset'] for item in valid_items]
-    snrs = [item['echo']['snr'] for item in valid_items]
-    dts = [item['echo']['dt'] for item in valid_items]
-    azs = [item['pycom']['az'] for item in valid_items]
-    els = [item['pycom']['el'] for item in valid_items]
-    ranges = [item['pycom']['range_km'] for item in valid_items]
-    dop_ups = [item['pycom']['dop_up'] for item in valid_items]
-    dop_downs = [item['pycom']['dop_down'] for item in valid_items]
-    total_freqs = [item['pycom']['main'] + item['pycom']['sub'] for item in valid_items]
+    # Columns: offset delta, SNR, DT, az, el, range, doppler up/down, total freq
+    arr = np.empty((num_with_sat, 9), dtype=np.float64)
+    for i, item in enumerate(valid_items):
+        e = item['echo']
+        p = item['pycom']
+        arr[i] = (e['tx_offset'] - e['rx_offset'], e['snr'], e['dt'],
+                  p['az'], p['el'], p['range_km'],
+                  p['dop_up'], p['dop_down'], p['main'] + p['sub'])
+    means = arr.mean(axis=0)
+    stds = arr.std(axis=0)
+    mins = arr.min(axis=0)
+    maxs = arr.max(axis=0)
     min_drift = valid_items[0]['pycom']['main'] + valid_items[0]['echo']['rx_offset'] + valid_items[0]['pycom']['sub'] - valid_items[0]['echo']['tx_offset']
     max_drift = valid_items[-1]['pycom']['main'] + valid_items[-1]['echo']['rx_offset'] + valid_items[-1]['pycom']['sub'] - valid_items[-1]['echo']['tx_offset']
     center_drift = round((min_drift + max_drift) / 2)
@@ -222,29 +348,43 @@ def calculate_pass_stats(pass_group):
     return {
         'num_echoes': num_echoes,
         'num_with_sat': num_with_sat,
-        'offset_delta_mean_hz': round(np.mean(offset_deltas), 1),
-        'offset_delta_std_hz': round(np.std(offset_deltas), 1),
-        'snr_mean_db': round(np.mean(snrs), 1),
-        'snr_min_db': int(np.min(snrs)),
-        'snr_max_db': int(np.max(snrs)),
-        'dt_mean_s': round(np.mean(dts), 2),
-        'az_mean_deg': round(np.mean(azs), 1),
-        'az_min_deg': round(np.min(azs), 1),
-        'az_max_deg': round(np.max(azs), 1),
-        'el_mean_deg': round(np.mean(els), 1),
-        'el_max_deg': round(np.max(els), 1),
-        'range_min_km': int(np.min(ranges)),
-        'dop_up_mean_hz': int(np.round(np.mean(dop_ups))),
-        'dop_down_mean_hz': int(np.round(np.mean(dop_downs))),
-        'total_freq_min_hz': int(np.min(total_freqs)),
-        'total_freq_max_hz': int(np.max(total_freqs)),
-        'total_freq_mean_hz': round(np.mean(total_freqs), 1),
-        'total_freq_std_hz': round(np.std(total_freqs), 1),
+        'offset_delta_mean_hz': round(means[0], 1),
+        'offset_delta_std_hz': round(stds[0], 1),
+        'snr_mean_db': round(means[1], 1),
+        'snr_min_db': int(mins[1]),
+        'snr_max_db': int(maxs[1]),
+        'dt_mean_s': round(means[2], 2),
+        'az_mean_deg': round(means[3], 1),
+        'az_min_deg': round(mins[3], 1),
+        'az_max_deg': round(maxs[3], 1),
+        'el_mean_deg': round(means[4], 1),
+        'el_max_deg': round(maxs[4], 1),
+        'range_min_km': int(mins[5]),
+        'dop_up_mean_hz': int(np.round(means[6])),
+        'dop_down_mean_hz': int(np.round(means[7])),
+        'total_freq_min_hz': int(mins[8]),
+        'total_freq_max_hz': int(maxs[8]),
+        'total_freq_mean_hz': round(means[8], 1),
+        'total_freq_std_hz': round(stds[8], 1),
         'center_drift': center_drift,
     }
 
 
-def extract_full_pass_track(pass_group, all_pycom_entries):
+def index_pycom_by_sat(pycom_entries):
+    """
+    Group time-sorted pycom entries by satellite.
+    Returns: dict of sat_name -> (ts_epoch array, entries list)
+    """
+    groups = {}
+    for p in pycom_entries:
+        groups.setdefault(p['sat'], []).append(p)
+    return {
+        sat: (np.fromiter((p['ts_epoch'] for p in group), dtype=np.float64, count=len(group)), group)
+        for sat, group in groups.items()
+    }
+
+
+def extract_full_pass_track(pass_group, pycom_by_sat):
     """
     Extract all real tracking points from pycom.log for this pass.
     Returns: list of (az, el), start_dt, end_dt, sat_name
@@ -259,13 +399,13 @@ def extract_full_pass_track(pass_group, all_pycom_entries):
     start_echo = valid_items[0]['echo']['ts']
     end_echo = valid_items[-1]['echo']['ts']
 
-    window_start = start_echo - PASS_MARGIN
-    window_end = end_echo + PASS_MARGIN
+    ts_arr, entries = pycom_by_sat[sat_name]
+    lo = np.searchsorted(ts_arr, valid_items[0]['echo']['ts_epoch'] - PASS_MARGIN, 'left')
+    hi = np.searchsorted(ts_arr, valid_items[-1]['echo']['ts_epoch'] + PASS_MARGIN, 'right')
 
     track_points = [
         (p['az'], max(p['el'], 0), p['range_km'], p['main'], p['sub'], p['dop_up'], p['dop_down'])  # clip negative elevation
-        for p in all_pycom_entries
-        if p['sat'] == sat_name and window_start <= p['ts'] <= window_end
+        for p in entries[lo:hi]
     ]
 
     if len(track_points) < 2:
@@ -274,57 +414,57 @@ def extract_full_pass_track(pass_group, all_pycom_entries):
     return track_points, start_echo, end_echo, sat_name
 
 
-def export_pass(csv_heading, pass_group, pass_num, track_data, center_drift):
-    base_name = None
+def render_rows(pass_group, center_drift):
+    """
+    Format every echo in a pass as a row of CSV_HEADING values.
+    Echoes without satellite data only carry the leading echo columns.
+    """
+    rows = []
     for item in pass_group:
-        if not 'pycom' in item:
-            continue
-        
-        pycom = item['pycom']
-        sat_name = pycom['sat']
-        start_ts_str = item['echo']['ts_str']
-        yy = 2000 + int(start_ts_str[:2])
-        mm, dd = int(start_ts_str[2:4]), int(start_ts_str[4:6])
-        hh, mi, ss = int(start_ts_str[7:9]), int(start_ts_str[9:11]), int(start_ts_str[11:13])
-        start_dt = datetime(yy, mm, dd, hh, mi, ss)
-
-        base_name = start_dt.strftime('%Y%m%d_%H%M%S') + f"_{sat_name}"
-        break
-        
-    if not base_name:
+        e = item['echo']
+        row = (e['ts_str'], e['tx_offset'], e['rx_offset'], e['tx_offset'] - e['rx_offset'],
+               e['message'], e['snr'], e['dt'])
+        if 'pycom' in item:
+            p = item['pycom']
+            total = p['main'] + p['sub']
+            drift = total + e['rx_offset'] - e['tx_offset'] - center_drift
+            row += (
+                p['sat'], f"{p['az']:.1f}", f"{p['el']:.1f}", f"{p['range_km']:.0f}",
+                p['main'], p['sub'], total, p['dop_up'], p['dop_down'], p['offset'],
+                p['rit'], p['rit_freq'], f"{item['time_diff']:.0f}", drift,
+                drift - p['dop_up'] - p['dop_down'],
+                p['dop_up_rate'], p['dop_down_rate']
+            )
+        rows.append(row)
+    return rows
+
+
+def export_pass(pass_group, pass_num, track_data, rows):
+    """
+    Write the rendered rows of echoes with satellite data to CSV and the
+    real tracking path to JSON.
+    """
+    first = next((item for item in pass_group if 'pycom' in item), None)
+    if first is None:
         return
 
+    sat_name = first['pycom']['sat']
+    base_name = first['echo']['ts'].strftime('%Y%m%d_%H%M%S') + f"_{sat_name}"
+
     # CSV export (unchanged columns)
     csv_file = OUTPUT_DIR / f"{base_name}.csv"
-    if not os.path.exists(csv_file):
+    if not csv_file.exists():
         with csv_file.open('w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(csv_heading)
-
-            for item in pass_group:
-                if 'pycom' not in item:
-                    continue
-                e = item['echo']
-                p = item['pycom']
-                time_diff = item['time_diff']
-                offset_delta = e['tx_offset'] - e['rx_offset']
-                drift = p['main'] + e['rx_offset'] + p['sub'] - e['tx_offset'] - center_drift
-                rd = drift - p['dop_up'] - p['dop_down']
-                writer.writerow([
-                    e['ts_str'], e['tx_offset'], e['rx_offset'], offset_delta,
-                    e['message'], e['snr'], e['dt'], p['sat'],
-                    f"{p['az']:.1f}", f"{p['el']:.1f}", f"{p['range_km']:.0f}",
-                    p['main'], p['sub'], p['main'] + p['sub'], p['dop_up'], p['dop_down'], p['offset'],
-                    p['rit'], p['rit_freq'], f"{time_diff:.0f}", drift, rd,
-                    p['dop_up_rate'], p['dop_down_rate']
-                ])
-
-        print(f"  → Exported {len([i for i in pass_group if 'pycom' in i])} echoes to: {csv_file.name}")
+            writer.writerow(CSV_HEADING)
+            writer.writerows(rows)
+
+        print(f"  → Exported {len(rows)} echoes to: {csv_file.name}")
 
     # JSON track export
     if track_data:
         json_file = OUTPUT_DIR / f"{base_name}.json"
-        if not os.path.exists(json_file):
+        if not json_file.exists():
             track_dict = {
                 "sat": sat_name,
                 "start_time": track_data[1].isoformat(),
@@ -339,15 +479,22 @@ def export_pass(csv_heading, pass_group, pass_num, track_data, center_drift):
 def main():
     print("Loading and processing logs...\n")
 
-    tx_entries = load_wsjt_entries(WSJT_TX_LOG, 'Tx')
-    rx_entries = load_wsjt_entries(WSJT_RX_LOG, 'Rx')
-    all_pycom_entries = parse_pycom_log(PYCOM_LOG)
+    # The three logs are independent, so parse them in separate processes
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        tx_future = executor.submit(load_wsjt_entries, WSJT_TX_LOG, 'Tx')
+        rx_future = executor.submit(load_wsjt_entries, WSJT_RX_LOG, 'Rx')
+        pycom_future = executor.submit(parse_pycom_log, PYCOM_LOG)
+        tx_entries = tx_future.result()
+        rx_entries = rx_future.result()
+        all_pycom_entries = pycom_future.result()
+    pycom_ts = [p['ts_epoch'] for p in all_pycom_entries]
+    pycom_by_sat = index_pycom_by_sat(all_pycom_entries)
 
     echoes = find_echoes(tx_entries, rx_entries)
 
     combined = []
     for echo in echoes:
-        pycom, time_diff = match_echo_to_pycom(echo, all_pycom_entries)
+        pycom, time_diff = match_echo_to_pycom(echo, all_pycom_entries, pycom_ts)
         if pycom:
             combined.append({
                 'echo': echo,
@@ -361,15 +508,6 @@ def main():
 
     print(f"Found {len(echoes)} total echoes in {len(passes)} pass(es):\n")
 
-    csv_heading = "Timestamp, Tx Offset Hz, Rx Offset Hz, Offset delta Hz, Message, SNR dB, DT s, Sat, Az °, El °, Range km, Main Hz, Sub Hz, Main + Sub Hz, Doppler up Hz, Doppler down Hz, Tuning Offset Hz, RIT, RIT Freq Hz, Time diff s, Drift, Residual Doppler"
-    csv_heading = [
-                "Timestamp", "Tx Offset Hz", "Rx Offset Hz", "Offset Delta Hz",
-                "Message", "SNR dB", "DT s", "Sat", "Az °", "El °", "Range km",
-                "Main Hz", "Sub Hz", "Main+Sub Hz", "Doppler up Hz", "Doppler down Hz", "Tuning Offset Hz",
-                "RIT", "RIT Freq Hz", "Time diff s", "Drift", "Residual Doppler",
-                "Doppler up rate", "Doppler down rate"
-            ]
-
     for i, pass_group in enumerate(passes, 1):
         has_sat_data = any('pycom' in item for item in pass_group)
         first_pycom = next((item['pycom'] for item in pass_group if 'pycom' in item), None)
@@ -394,30 +532,22 @@ def main():
             print(f"   Doppler down mean: {stats['dop_down_mean_hz']} Hz")
             print(f"   Total tuned freq: {stats['total_freq_min_hz']} → {stats['total_freq_max_hz']} Hz\n")
 
-        print(",".join(csv_heading))
-        for item in pass_group:
-            e = item['echo']
-            if 'pycom' in item:
-                p = item['pycom']
-                time_diff = item['time_diff']
-                drift = p['main'] + e['rx_offset'] + p['sub'] - e['tx_offset'] - stats['center_drift']
-                rd = drift - p['dop_up'] - p['dop_down']
-                sat_info = (f", {p['sat']}, {p['az']:.1f}, {p['el']:.1f}, "
-                            f"{p['range_km']:.0f}, {p['main']}, {p['sub']}, "
-                            f"{p['main'] + p['sub']}, {p['dop_up']}, {p['dop_down']}, {p['offset']}, "
-                            f"{p['rit']}, {p['rit_freq']}, {time_diff:.0f}, {drift}, {rd}, "
-                            f"{p['dop_up_rate']}, {p['dop_down_rate']}")
-            else:
-                sat_info = ", No satellite data available"
-
-            offset_delta = e['tx_offset'] - e['rx_offset']
-            print(f"{e['ts_str']}, {e['tx_offset']}, {e['rx_offset']}, "
-                  f"{offset_delta}, {e['message']}, {e['snr']}, {e['dt']}{sat_info}")
+        rows = render_rows(pass_group, stats['center_drift'])
+
+        # Emit the heading and all rows of the pass with a single write
+        out_lines = [",".join(CSV_HEADING)]
+        for item, row in zip(pass_group, rows):
+            line = ", ".join(map(str, row))
+            if 'pycom' not in item:
+                line += ", No satellite data available"
+            out_lines.append(line)
+        sys.stdout.write("\n".join(out_lines) + "\n")
 
         # Extract real track
-        track_data = extract_full_pass_track(pass_group, all_pycom_entries)
+        track_data = extract_full_pass_track(pass_group, pycom_by_sat)
 
-        export_pass(csv_heading, pass_group, i, track_data, stats['center_drift'])
+        sat_rows = [row for item, row in zip(pass_group, rows) if 'pycom' in item]
+        export_pass(pass_group, i, track_data, sat_rows)
 
     if not echoes:
         print("No echoes found.")
@@ -1,8 +1,9 @@
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
-import os
 import re
-import csv
+import warnings
 import json
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +11,9 @@ from pathlib import Path
 # Directory containing the CSV and JSON files
 directory = "./echo_passes"
 
+# Pass files are named <YYYYMMDD>_<HHMMSS>_<SAT>.csv
+FILENAME_PATTERN = re.compile(r"(\d{8})_(\d{6})_(.+)\.csv", re.IGNORECASE)
+
 # Markers and colors
 markers = ['o', 'v', '^', '<', '>', 's', 'p', 'P', '*', 'h', 'H', 'D', 'd', 'X', '+', 'x', '|', '_', '1', '2', '3', '4', '8']
 color_list = plt.cm.tab20.colors
@@ -18,11 +22,9 @@ satellite_list = []
 data = {}  # satellite -> pass_name -> info (decode points)
 
 # Load decode points from CSVs
-for filename in os.listdir(directory):
-    if not filename.lower().endswith(".csv"):
-        continue
-
-    match = re.match(r"(\d{8})_(\d{6})_(.+)\.csv", filename, re.IGNORECASE)
+for filepath in sorted(Path(directory).glob("*.[cC][sS][vV]")):
+    filename = filepath.name
+    match = FILENAME_PATTERN.match(filename)
     if not match:
         print(f"Skipping {filename}: filename format not recognized")
         continue
@@ -36,26 +38,15 @@ for filename in os.listdir(directory):
     except:
         pass_label = f"{sat_name} {date_str}_{time_str}"
 
-    filepath = Path(directory) / filename
-
-    az_list = []
-    el_list = []
-
-    with open(filepath, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        next(reader)  # Skip header
-        for row in reader:
-            if len(row) < 10:
-                continue
-            try:
-                az = float(row[8])   # Az column
-                el = float(row[9])   # El column
-                az_list.append(az)
-                el_list.append(el)
-            except ValueError:
-                continue
-
-    if len(az_list) == 0:
+    # Az and El columns; short rows are dropped and unparsable values become NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        coords = np.genfromtxt(filepath, delimiter=',', skip_header=1, usecols=(8, 9),
+                               dtype=np.float64, encoding='utf-8', invalid_raise=False)
+    coords = coords.reshape(-1, 2)
+    coords = coords[~np.isnan(coords).any(axis=1)]
+
+    if len(coords) == 0:
         print(f"Skipping {filename}: no valid decode points")
         continue
 
@@ -70,11 +61,32 @@ for filename in os.listdir(directory):
     pass_count = len(data[sat_name])
     marker = markers[pass_count % len(markers)]
 
+    # Load corresponding real track from JSON
+    track_az_rad = None
+    track_r = None
+    base_name = pass_date.strftime('%Y%m%d_%H%M%S') + f"_{sat_name}"
+    json_path = Path(directory) / f"{base_name}.json"
+
+    if json_path.exists():
+        try:
+            track = json.loads(json_path.read_bytes())
+            points = track["points"]
+            if points:
+                track_az_rad = np.deg2rad([p["az"] for p in points])
+                track_r = 90.0 - np.array([p["el"] for p in points])
+        except Exception as e:
+            print(f"Error reading track {json_path}: {e}")
+    else:
+        print(f"No real track JSON found for {pass_label}")
+
+    # Store plot coordinates (azimuth in radians, radius = 90 - elevation)
     data[sat_name][pass_label] = {
         "color": color,
         "marker": marker,
-        "az": az_list,
-        "el": el_list,
+        "az_rad": np.deg2rad(coords[:, 0]),
+        "r": 90.0 - coords[:, 1],
+        "track_az_rad": track_az_rad,
+        "track_r": track_r,
         "date": pass_date,
         "filename": filename
     }
@@ -99,49 +111,58 @@ else:
 
     ax.grid(True, linestyle="--", alpha=0.7)
 
-    # Plot each pass
+    # Gather every pass so decode points are drawn with one scatter per
+    # marker shape and all real tracks with a single LineCollection
+    points_by_marker = {}  # marker -> (az arrays, r arrays, colors)
+    track_segments = []
+    track_colors = []
+    legend_handles = []
+
     for sat_name, passes in data.items():
         for pass_name, info in passes.items():
-            # Decode points (scatter)
-            az_rad = np.deg2rad(info["az"])
-            r = 90 - np.array(info["el"])
-            ax.scatter(
-                az_rad, r,
-                color=info["color"],
+            az_parts, r_parts, colors = points_by_marker.setdefault(info["marker"], ([], [], []))
+            az_parts.append(info["az_rad"])
+            r_parts.append(info["r"])
+            colors.extend([info["color"]] * len(info["az_rad"]))
+
+            legend_handles.append(Line2D(
+                [], [],
+                linestyle="none",
                 marker=info["marker"],
-                s=100,
-                label=f'{pass_name} ({len(info["az"])} decodes)',
-                edgecolors="black",
-                linewidth=0.7,
-                zorder=3
-            )
-
-            # Load corresponding real track from JSON
-            base_name = info["date"].strftime('%Y%m%d_%H%M%S') + f"_{sat_name}"
-            json_path = Path(directory) / f"{base_name}.json"
-
-            if json_path.exists():
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        track = json.load(f)
-                    points = track["points"]
-                    if points:
-                        track_az = [p["az"] for p in points]
-                        track_el = [p["el"] for p in points]
-                        track_az_rad = np.deg2rad(track_az)
-                        track_r = 90 - np.array(track_el)
-                        ax.plot(track_az_rad, track_r,
-                                color=info["color"],
-                                linewidth=2.5,
-                                alpha=0.8,
-                                #label=f'{pass_name} track'
-                                )
-                except Exception as e:
-                    print(f"Error reading track {json_path}: {e}")
-            else:
-                print(f"No real track JSON found for {pass_name}")
-
-    ax.legend(loc="upper left", bbox_to_anchor=(1.1, 1.0), fontsize=9)
+                markersize=10,
+                markerfacecolor=info["color"],
+                # Unfilled markers ('+', 'x', ...) are drawn in the point colour by scatter
+                markeredgecolor="black" if info["marker"] in Line2D.filled_markers else info["color"],
+                markeredgewidth=0.7,
+                label=f'{pass_name} ({len(info["az_rad"])} decodes)'
+            ))
+
+            if info["track_az_rad"] is not None:
+                track_segments.append(np.column_stack((info["track_az_rad"], info["track_r"])))
+                track_colors.append(info["color"])
+
+    # Decode points (scatter)
+    for marker, (az_parts, r_parts, colors) in points_by_marker.items():
+        ax.scatter(
+            np.concatenate(az_parts), np.concatenate(r_parts),
+            c=colors,
+            marker=marker,
+            s=100,
+            edgecolors="black",
+            linewidth=0.7,
+            zorder=3
+        )
+
+    # Real tracks from JSON
+    if track_segments:
+        ax.add_collection(LineCollection(
+            track_segments,
+            colors=track_colors,
+            linewidths=2.5,
+            alpha=0.8
+        ))
+
+    ax.legend(handles=legend_handles, loc="upper left", bbox_to_anchor=(1.1, 1.0), fontsize=9)
 
     satellites_plotted = ", ".join(data.keys()) or "None"
     ax.set_title(